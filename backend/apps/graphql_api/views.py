@@ -1,3 +1,120 @@
-from django.shortcuts import render
+"""
+GraphQL view with a persisted-document cache.
 
-# Create your views here.
+The frontend ships a fixed set of operation strings, so the server sees
+the same queries over and over. Re-parsing and re-validating the AST on
+every request is pure overhead; this view memoizes the parsed document
+and its validation result keyed by a hash of the query string, in the
+spirit of automatic persisted queries.
+"""
+
+import hashlib
+
+from django.db import connection, transaction
+from django.http import HttpResponseNotAllowed
+from django.http.response import HttpResponseBadRequest
+from graphql import ExecutionResult, OperationType, execute, get_operation_ast, parse
+from graphql.validation import validate
+
+from graphene_django.constants import MUTATION_ERRORS_FLAG
+from graphene_django.settings import graphene_settings
+from graphene_django.views import GraphQLView, HttpError
+
+
+class CachedGraphQLView(GraphQLView):
+    """GraphQLView that skips parse/validate for previously seen queries."""
+
+    # query hash -> (document, validation_errors); bounded so a hostile
+    # client cannot grow the cache without limit.
+    _document_cache = {}
+    _document_cache_max_entries = 512
+
+    def get_parsed_document(self, schema, query):
+        """Return (document, validation_errors), memoized per query string."""
+        key = hashlib.sha256(query.encode()).hexdigest()
+        entry = self._document_cache.get(key)
+        if entry is None:
+            document = parse(query)
+            validation_errors = validate(
+                schema,
+                document,
+                self.validation_rules,
+                graphene_settings.MAX_VALIDATION_ERRORS,
+            )
+            if len(self._document_cache) >= self._document_cache_max_entries:
+                self._document_cache.clear()
+            entry = (document, validation_errors)
+            self._document_cache[key] = entry
+        return entry
+
+    def execute_graphql_request(
+        self, request, data, query, variables, operation_name, show_graphiql=False
+    ):
+        # Mirrors GraphQLView.execute_graphql_request with parsing and
+        # validation routed through the document cache. The per-request
+        # validate_schema() call is dropped: the schema is static for the
+        # lifetime of the process.
+        if not query:
+            if show_graphiql:
+                return None
+            raise HttpError(HttpResponseBadRequest("Must provide query string."))
+
+        schema = self.schema.graphql_schema
+
+        try:
+            document, validation_errors = self.get_parsed_document(schema, query)
+        except Exception as e:
+            return ExecutionResult(errors=[e])
+
+        operation_ast = get_operation_ast(document, operation_name)
+
+        if (
+            request.method.lower() == "get"
+            and operation_ast is not None
+            and operation_ast.operation != OperationType.QUERY
+        ):
+            if show_graphiql:
+                return None
+
+            raise HttpError(
+                HttpResponseNotAllowed(
+                    ["POST"],
+                    "Can only perform a {} operation from a POST request.".format(
+                        operation_ast.operation.value
+                    ),
+                )
+            )
+
+        if validation_errors:
+            return ExecutionResult(data=None, errors=validation_errors)
+
+        try:
+            execute_options = {
+                "root_value": self.get_root_value(request),
+                "context_value": self.get_context(request),
+                "variable_values": variables,
+                "operation_name": operation_name,
+                "middleware": self.get_middleware(request),
+            }
+            if self.execution_context_class:
+                execute_options[
+                    "execution_context_class"
+                ] = self.execution_context_class
+
+            if (
+                operation_ast is not None
+                and operation_ast.operation == OperationType.MUTATION
+                and (
+                    graphene_settings.ATOMIC_MUTATIONS is True
+                    or connection.settings_dict.get("ATOMIC_MUTATIONS", False) is True
+                )
+            ):
+                with transaction.atomic():
+                    result = execute(schema, document, **execute_options)
+                    if getattr(request, MUTATION_ERRORS_FLAG, False) is True:
+                        transaction.set_rollback(True)
+                return result
+
+            return execute(schema, document, **execute_options)
+        except Exception as e:
+            return ExecutionResult(errors=[e])
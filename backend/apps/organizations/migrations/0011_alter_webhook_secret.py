@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-09-01 15:03
+
+import apps.organizations.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0010_organizationmember_joined_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='webhook',
+            name='secret',
+            field=models.CharField(default=apps.organizations.models.generate_webhook_secret, max_length=255),
+        ),
+    ]
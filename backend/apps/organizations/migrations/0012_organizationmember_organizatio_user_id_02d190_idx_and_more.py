@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-09-01 15:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0011_alter_webhook_secret'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organizationmember',
+            index=models.Index(fields=['user', 'organization'], name='organizatio_user_id_02d190_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='organizationmember',
+            index=models.Index(fields=['organization', 'role'], name='organizatio_organiz_8fe467_idx'),
+        ),
+    ]
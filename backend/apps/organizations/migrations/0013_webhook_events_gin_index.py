@@ -0,0 +1,31 @@
+from django.db import migrations
+
+
+def create_gin_index(apps, schema_editor):
+    # GIN indexes are Postgres-only; SQLite development databases rely on
+    # the Python-side event check instead.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS organizations_webhook_events_gin '
+        'ON organizations_webhook USING gin (events)'
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'DROP INDEX IF EXISTS organizations_webhook_events_gin'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0012_organizationmember_organizatio_user_id_02d190_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-09-01 15:17
+
+import apps.organizations.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0013_webhook_events_gin_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='organization',
+            name='uid',
+            field=models.CharField(blank=True, default=apps.organizations.models.generate_organization_uid, max_length=12, unique=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-09-01 15:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0014_alter_organization_uid'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='webhook',
+            index=models.Index(fields=['organization', 'is_active'], name='organizatio_organiz_af5d28_idx'),
+        ),
+    ]
@@ -1,18 +1,32 @@
+import secrets
+
 from django.db import models
 from django.utils.text import slugify
 from apps.users.models import User
 
 
+def generate_webhook_secret():
+    """Default signing secret for new webhooks."""
+    return secrets.token_hex(20)
+
+
+def generate_organization_uid():
+    """Default public identifier for new organizations."""
+    return secrets.token_hex(6).upper()
+
+
 class Organization(models.Model):
     name = models.CharField(max_length=100)
     slug = models.SlugField(unique=True)
-    uid = models.CharField(max_length=12, unique=True, blank=True)
+    uid = models.CharField(max_length=12, unique=True, blank=True, default=generate_organization_uid)
     contact_email = models.EmailField()
     description = models.TextField(blank=True, default="")
     created_at = models.DateTimeField(auto_now_add=True)
 
     def save(self, *args, **kwargs):
-        if not self.slug:
+        # Only derive the slug on first insert; updates keep whatever slug
+        # the row already has and skip the slugify pass entirely.
+        if self.pk is None and not self.slug:
             self.slug = slugify(self.name)
         super().save(*args, **kwargs)
 
@@ -28,6 +42,14 @@ class OrganizationMember(models.Model):
     role = models.CharField(max_length=20, choices=Role.choices, default=Role.MEMBER)
     joined_at = models.DateTimeField(auto_now_add=True, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # Covers the per-request membership lookup (user, organization)
+            # and role-scoped listings within an organization.
+            models.Index(fields=['user', 'organization']),
+            models.Index(fields=['organization', 'role']),
+        ]
+
     def can_manage_projects(self):
         return self.role in [self.Role.OWNER, self.Role.ADMIN]
 
@@ -40,15 +62,31 @@ class OrganizationMember(models.Model):
     def is_read_only(self):
         return self.role == self.Role.VIEWER
 
+    def permissions(self):
+        """Return all role predicates in one dict, computed without DB access."""
+        return {
+            'manage_projects': self.can_manage_projects(),
+            'manage_members': self.can_manage_members(),
+            'edit_tasks': self.can_edit_tasks(),
+            'read_only': self.is_read_only(),
+        }
+
 
 class Webhook(models.Model):
     organization = models.ForeignKey(Organization, on_delete=models.CASCADE, related_name='webhooks')
     url = models.URLField(max_length=500)
-    secret = models.CharField(max_length=255)
+    secret = models.CharField(max_length=255, default=generate_webhook_secret)
     events = models.JSONField(default=list)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # The task post_save signal runs this exact filter on every
+            # task write.
+            models.Index(fields=['organization', 'is_active']),
+        ]
+
     def __str__(self):
         return f"Webhook for {self.organization.name} - {self.url}"
@@ -3,7 +3,9 @@ Management command to seed demo data for demonstration purposes.
 Creates a demo organization with projects, tasks, and comments.
 """
 
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 from django.contrib.auth import get_user_model
 from apps.organizations.models import Organization, OrganizationMember
 from apps.projects.models import Project, Task, TaskComment
@@ -15,40 +17,62 @@ class Command(BaseCommand):
     help = 'Seeds the database with demo data for demonstration'
 
     def handle(self, *args, **options):
-        self.stdout.write('🌱 Seeding demo data...\n')
-
-        # Create demo user
-        demo_user, created = User.objects.get_or_create(
-            email='demo@example.com',
-            defaults={
-                'full_name': 'Demo User',
-                'is_active': True,
-            }
-        )
-        if created:
-            demo_user.set_password('demo1234')
-            demo_user.save()
-            self.stdout.write(self.style.SUCCESS('✅ Created demo user: demo@example.com / demo1234'))
-        else:
-            self.stdout.write('ℹ️  Demo user already exists')
-
-        # Create team members
-        team_members = [
+        # One transaction for the whole run: dozens of autocommit fsyncs
+        # collapse into a single commit at the end.
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # Seed data is re-runnable, so a lost commit on crash is
+                # harmless; skipping the WAL flush wait speeds up seeding.
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL synchronous_commit = OFF')
+            self._seed()
+
+    def _seed(self):
+        # Buffer progress lines and flush them in a single write at the
+        # end; per-line writes dominate no-op re-seed runs in CI logs.
+        messages = ['🌱 Seeding demo data...\n']
+
+        # Create demo user and team members in one batch
+        user_specs = [
+            ('demo@example.com', 'Demo User'),
             ('alice@demo.com', 'Alice Johnson'),
             ('bob@demo.com', 'Bob Smith'),
             ('carol@demo.com', 'Carol Williams'),
         ]
-        
-        users = [demo_user]
-        for email, name in team_members:
-            user, created = User.objects.get_or_create(
-                email=email,
-                defaults={'full_name': name, 'is_active': True}
-            )
-            if created:
-                user.set_password('demo1234')
-                user.save()
-            users.append(user)
+        emails = [email for email, _ in user_specs]
+        existing_emails = set(
+            User.objects.filter(email__in=emails).values_list('email', flat=True)
+        )
+        # PBKDF2 dominates seeding CPU; every demo account shares the same
+        # password, so hash it once.
+        demo_password = make_password('demo1234')
+        # Upsert in one statement: new rows are inserted, re-runs just
+        # refresh full_name on the existing accounts.
+        User.objects.bulk_create(
+            [
+                User(
+                    email=email,
+                    full_name=name,
+                    is_active=True,
+                    password=demo_password,
+                )
+                for email, name in user_specs
+            ],
+            update_conflicts=True,
+            unique_fields=['email'],
+            update_fields=['full_name'],
+            batch_size=500,
+        )
+        # Django 4.2 does not populate PKs on conflict-handling bulk_create,
+        # so one re-fetch is still needed to parent memberships and tasks.
+        users_by_email = User.objects.in_bulk(emails, field_name='email')
+        users = [users_by_email[email] for email in emails]
+        demo_user = users_by_email['demo@example.com']
+
+        if 'demo@example.com' in existing_emails:
+            messages.append('ℹ️  Demo user already exists')
+        else:
+            messages.append(self.style.SUCCESS('✅ Created demo user: demo@example.com / demo1234'))
 
         # Create demo organization
         demo_org, created = Organization.objects.get_or_create(
@@ -59,23 +83,34 @@ class Command(BaseCommand):
             }
         )
         if created:
-            self.stdout.write(self.style.SUCCESS('✅ Created demo organization: Demo Company'))
+            messages.append(self.style.SUCCESS('✅ Created demo organization: Demo Company'))
         else:
-            self.stdout.write('ℹ️  Demo organization already exists')
+            messages.append('ℹ️  Demo organization already exists')
 
-        # Add members to organization
+        # Add members to organization in one batch; skip users who already
+        # belong, since OrganizationMember has no unique constraint for
+        # ignore_conflicts to lean on.
         roles = [
             OrganizationMember.Role.OWNER,
             OrganizationMember.Role.ADMIN,
             OrganizationMember.Role.MEMBER,
             OrganizationMember.Role.VIEWER,
         ]
-        for i, user in enumerate(users):
-            OrganizationMember.objects.get_or_create(
-                user=user,
-                organization=demo_org,
-                defaults={'role': roles[i % len(roles)]}
-            )
+        member_ids = set(
+            OrganizationMember.objects.filter(organization=demo_org).values_list('user_id', flat=True)
+        )
+        OrganizationMember.objects.bulk_create(
+            [
+                OrganizationMember(
+                    user=user,
+                    organization=demo_org,
+                    role=roles[i % len(roles)],
+                )
+                for i, user in enumerate(users)
+                if user.pk not in member_ids
+            ],
+            batch_size=500,
+        )
 
         # Create projects
         projects_data = [
@@ -96,19 +131,20 @@ class Command(BaseCommand):
             },
         ]
 
-        projects = []
-        for proj_data in projects_data:
-            project, created = Project.objects.get_or_create(
-                organization=demo_org,
-                name=proj_data['name'],
-                defaults={
-                    'description': proj_data['description'],
-                    'status': proj_data['status'],
-                }
-            )
-            projects.append(project)
-            if created:
-                self.stdout.write(f'  📁 Created project: {project.name}')
+        existing_projects = {
+            project.name: project
+            for project in Project.objects.filter(organization=demo_org)
+        }
+        new_projects = [
+            Project(organization=demo_org, **proj_data)
+            for proj_data in projects_data
+            if proj_data['name'] not in existing_projects
+        ]
+        Project.objects.bulk_create(new_projects, batch_size=500)
+        for project in new_projects:
+            existing_projects[project.name] = project
+            messages.append(f'  📁 Created project: {project.name}')
+        projects = [existing_projects[proj_data['name']] for proj_data in projects_data]
 
         # Create tasks for Website Redesign project
         website_project = projects[0]
@@ -117,81 +153,92 @@ class Command(BaseCommand):
             {'title': 'Design homepage mockup', 'description': 'Create high-fidelity mockup for the new homepage', 'status': Task.Status.TODO, 'priority': Task.Priority.HIGH},
             {'title': 'Review competitor websites', 'description': 'Analyze top 5 competitor websites for inspiration', 'status': Task.Status.TODO, 'priority': Task.Priority.MEDIUM},
             {'title': 'Set up analytics tracking', 'description': 'Implement Google Analytics 4 and event tracking', 'status': Task.Status.TODO, 'priority': Task.Priority.LOW},
-            
+
             # In Progress
-            {'title': 'Implement responsive navigation', 'description': 'Build mobile-friendly hamburger menu with smooth animations', 'status': Task.Status.IN_PROGRESS, 'priority': Task.Priority.HIGH, 'assignee': users[1]},
-            {'title': 'Optimize image loading', 'description': 'Implement lazy loading and WebP format support', 'status': Task.Status.IN_PROGRESS, 'priority': Task.Priority.MEDIUM, 'assignee': users[2]},
-            
+            {'title': 'Implement responsive navigation', 'description': 'Build mobile-friendly hamburger menu with smooth animations', 'status': Task.Status.IN_PROGRESS, 'priority': Task.Priority.HIGH, 'assignee': users_by_email['alice@demo.com']},
+            {'title': 'Optimize image loading', 'description': 'Implement lazy loading and WebP format support', 'status': Task.Status.IN_PROGRESS, 'priority': Task.Priority.MEDIUM, 'assignee': users_by_email['bob@demo.com']},
+
             # Done
             {'title': 'Project kickoff meeting', 'description': 'Initial meeting with stakeholders to define scope', 'status': Task.Status.DONE, 'priority': Task.Priority.URGENT},
             {'title': 'Create wireframes', 'description': 'Low-fidelity wireframes for all main pages', 'status': Task.Status.DONE, 'priority': Task.Priority.HIGH},
-            {'title': 'Set up development environment', 'description': 'Configure local dev, staging, and CI/CD pipeline', 'status': Task.Status.DONE, 'priority': Task.Priority.MEDIUM, 'assignee': users[1]},
+            {'title': 'Set up development environment', 'description': 'Configure local dev, staging, and CI/CD pipeline', 'status': Task.Status.DONE, 'priority': Task.Priority.MEDIUM, 'assignee': users_by_email['alice@demo.com']},
         ]
 
-        for i, task_data in enumerate(tasks_data):
-            assignee = task_data.pop('assignee', None)
-            task, created = Task.objects.get_or_create(
-                project=website_project,
-                title=task_data['title'],
-                defaults={
-                    **task_data,
-                    'assignee': assignee,
-                    'order': i,
-                }
-            )
-            if created:
-                self.stdout.write(f'    ✓ Created task: {task.title}')
-                
-                # Add comments to some tasks
-                if task.status == Task.Status.DONE:
-                    TaskComment.objects.create(
-                        task=task,
-                        author=demo_user,
-                        content='Great work on this! ✅'
-                    )
-                elif task.status == Task.Status.IN_PROGRESS:
-                    TaskComment.objects.create(
-                        task=task,
-                        author=users[1] if len(users) > 1 else demo_user,
-                        content='Working on this now, should be done by EOD.'
-                    )
-                    TaskComment.objects.create(
-                        task=task,
-                        author=demo_user,
-                        content='Let me know if you need any help!'
-                    )
+        existing_titles = set(
+            Task.objects.filter(project=website_project).values_list('title', flat=True)
+        )
+        new_tasks = [
+            Task(project=website_project, order=i, **task_data)
+            for i, task_data in enumerate(tasks_data)
+            if task_data['title'] not in existing_titles
+        ]
+        # bulk_create populates PKs on PostgreSQL/SQLite, so the returned
+        # instances can parent comments directly.
+        Task.objects.bulk_create(new_tasks, batch_size=500)
+
+        comments = []
+        for task in new_tasks:
+            messages.append(f'    ✓ Created task: {task.title}')
+
+            # Add comments to some tasks
+            if task.status == Task.Status.DONE:
+                comments.append(TaskComment(
+                    task=task,
+                    author=demo_user,
+                    content='Great work on this! ✅'
+                ))
+            elif task.status == Task.Status.IN_PROGRESS:
+                comments.append(TaskComment(
+                    task=task,
+                    author=users_by_email['alice@demo.com'],
+                    content='Working on this now, should be done by EOD.'
+                ))
+                comments.append(TaskComment(
+                    task=task,
+                    author=demo_user,
+                    content='Let me know if you need any help!'
+                ))
+        TaskComment.objects.bulk_create(comments, batch_size=500)
 
         # Create tasks for Mobile App project
         mobile_project = projects[1]
         mobile_tasks = [
             {'title': 'Define app architecture', 'status': Task.Status.DONE, 'priority': Task.Priority.URGENT},
             {'title': 'Design onboarding flow', 'status': Task.Status.DONE, 'priority': Task.Priority.HIGH},
-            {'title': 'Implement user authentication', 'status': Task.Status.IN_PROGRESS, 'priority': Task.Priority.HIGH, 'assignee': users[2] if len(users) > 2 else demo_user},
+            {'title': 'Implement user authentication', 'status': Task.Status.IN_PROGRESS, 'priority': Task.Priority.HIGH, 'assignee': users_by_email['bob@demo.com']},
             {'title': 'Build dashboard screen', 'status': Task.Status.TODO, 'priority': Task.Priority.MEDIUM},
             {'title': 'Integrate push notifications', 'status': Task.Status.TODO, 'priority': Task.Priority.LOW},
         ]
 
-        for i, task_data in enumerate(mobile_tasks):
-            assignee = task_data.pop('assignee', None)
-            Task.objects.get_or_create(
-                project=mobile_project,
-                title=task_data['title'],
-                defaults={
-                    'description': '',
-                    'status': task_data['status'],
-                    'priority': task_data['priority'],
-                    'assignee': assignee,
-                    'order': i,
-                }
-            )
-
-        self.stdout.write('')
-        self.stdout.write(self.style.SUCCESS('🎉 Demo data seeded successfully!'))
-        self.stdout.write('')
-        self.stdout.write('📋 Demo Credentials:')
-        self.stdout.write('   Email: demo@example.com')
-        self.stdout.write('   Password: demo1234')
-        self.stdout.write('')
-        self.stdout.write('🏢 Demo Organization: Demo Company')
-        self.stdout.write(f'   Projects: {len(projects)}')
-        self.stdout.write(f'   Team Members: {len(users)}')
+        existing_mobile_titles = set(
+            Task.objects.filter(project=mobile_project).values_list('title', flat=True)
+        )
+        Task.objects.bulk_create(
+            [
+                Task(
+                    project=mobile_project,
+                    title=task_data['title'],
+                    description='',
+                    status=task_data['status'],
+                    priority=task_data['priority'],
+                    assignee=task_data.get('assignee'),
+                    order=i,
+                )
+                for i, task_data in enumerate(mobile_tasks)
+                if task_data['title'] not in existing_mobile_titles
+            ],
+            batch_size=500,
+        )
+
+        messages.append('')
+        messages.append(self.style.SUCCESS('🎉 Demo data seeded successfully!'))
+        messages.append('')
+        messages.append('📋 Demo Credentials:')
+        messages.append('   Email: demo@example.com')
+        messages.append('   Password: demo1234')
+        messages.append('')
+        messages.append('🏢 Demo Organization: Demo Company')
+        messages.append(f'   Projects: {len(projects)}')
+        messages.append(f'   Team Members: {len(users)}')
+
+        self.stdout.write('\n'.join(messages))
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-09-01 15:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_created_by_alter_project_due_date'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='tasks_project_fe19a5_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'status', 'order'], name='tasks_project_621f4a_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-09-01 15:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_remove_task_tasks_project_fe19a5_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'order', '-created_at'], name='tasks_project_3fe99d_idx'),
+        ),
+    ]
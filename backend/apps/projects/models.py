@@ -8,6 +8,22 @@ from apps.users.models import User
 from apps.organizations.models import Organization
 
 
+class ProjectQuerySet(models.QuerySet):
+    """Queryset helpers shared by the API, admin, and scripts."""
+
+    def with_org(self):
+        """Join the owning organization for list renders and __str__."""
+        return self.select_related('organization')
+
+
+class TaskQuerySet(models.QuerySet):
+    """Queryset helpers shared by the API, admin, and scripts."""
+
+    def with_related(self):
+        """Join the project chain and assignee for list renders."""
+        return self.select_related('project__organization', 'assignee')
+
+
 class Project(models.Model):
     """
     Organization-dependent project entity.
@@ -56,7 +72,9 @@ class Project(models.Model):
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    objects = ProjectQuerySet.as_manager()
+
     class Meta:
         db_table = 'projects'
         ordering = ['-created_at']
@@ -73,18 +91,21 @@ class Project(models.Model):
         return self.tasks.all()
     
     def get_task_stats(self):
-        """Return task statistics for this project."""
-        tasks = self.tasks.all()
-        total = tasks.count()
-        completed = tasks.filter(status=Task.Status.DONE).count()
-        in_progress = tasks.filter(status=Task.Status.IN_PROGRESS).count()
-        todo = tasks.filter(status=Task.Status.TODO).count()
-        
+        """Return task statistics for this project in a single query."""
+        counts = self.tasks.aggregate(
+            total=models.Count('id'),
+            completed=models.Count('id', filter=models.Q(status=Task.Status.DONE)),
+            in_progress=models.Count('id', filter=models.Q(status=Task.Status.IN_PROGRESS)),
+            todo=models.Count('id', filter=models.Q(status=Task.Status.TODO)),
+        )
+        total = counts['total']
+        completed = counts['completed']
+
         return {
             'total_tasks': total,
             'completed_tasks': completed,
-            'in_progress_tasks': in_progress,
-            'todo_tasks': todo,
+            'in_progress_tasks': counts['in_progress'],
+            'todo_tasks': counts['todo'],
             'completion_rate': (completed / total * 100) if total > 0 else 0
         }
 
@@ -150,12 +171,19 @@ class Task(models.Model):
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    objects = TaskQuerySet.as_manager()
+
     class Meta:
         db_table = 'tasks'
         ordering = ['order', '-created_at']
         indexes = [
-            models.Index(fields=['project', 'status']),
+            # (project, status, order) also covers the (project, status)
+            # filter and serves the board ordering without a sort step.
+            models.Index(fields=['project', 'status', 'order']),
+            # Serves the default ordering for unfiltered per-project task
+            # lists without a sort step.
+            models.Index(fields=['project', 'order', '-created_at']),
             models.Index(fields=['assignee']),
             models.Index(fields=['due_date']),
         ]
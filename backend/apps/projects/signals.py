@@ -1,49 +1,100 @@
+from django.db import connection, transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from .models import Task
 from apps.organizations.models import Webhook
 import requests
-import threading
+from requests.adapters import HTTPAdapter, Retry
 import json
 import hmac
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
-def send_webhook(url, secret, payload):
-    """Send webhook payload with HMAC signature."""
+# Shared pool for webhook delivery: bounded concurrency instead of one
+# short-lived OS thread per webhook per task save.
+_webhook_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='webhook')
+
+# Shared session so repeated deliveries to the same endpoint reuse
+# keep-alive connections instead of paying a TCP/TLS handshake per POST.
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+)
+_session = requests.Session()
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# Per-secret HMAC prototypes: .copy() reuses the derived key state, so
+# repeated deliveries for the same webhook only hash the payload.
+_hmac_cache = {}
+
+def _sign_payload(secret_bytes, payload_bytes):
+    base = _hmac_cache.get(secret_bytes)
+    if base is None:
+        base = _hmac_cache.setdefault(
+            secret_bytes, hmac.new(secret_bytes, digestmod=hashlib.sha256)
+        )
+    mac = base.copy()
+    mac.update(payload_bytes)
+    return mac.hexdigest()
+
+def send_webhook(url, secret_bytes, payload_bytes):
+    """Send a pre-serialized webhook payload with HMAC signature."""
     try:
         # Sign payload
-        payload_json = json.dumps(payload)
-        signature = hmac.new(
-            secret.encode(),
-            payload_json.encode(),
-            hashlib.sha256
-        ).hexdigest()
-        
+        signature = _sign_payload(secret_bytes, payload_bytes)
+
         headers = {
             'Content-Type': 'application/json',
             'X-Hub-Signature-256': f'sha256={signature}',
             'User-Agent': 'OrgaFlow-Webhook/1.0'
         }
-        
-        requests.post(url, data=payload_json, headers=headers, timeout=5)
+
+        _session.post(url, data=payload_bytes, headers=headers, timeout=5)
     except Exception as e:
         print(f"Webhook failed for {url}: {e}")
 
 @receiver(post_save, sender=Task)
 def task_updated(sender, instance, created, **kwargs):
-    """Trigger webhooks when a task is created or updated."""
+    """Schedule webhook dispatch for after the surrounding commit."""
+    # Keep the save transaction short: the webhook query and executor
+    # submissions run post-commit, and receivers never observe a task
+    # that ends up rolled back.
+    transaction.on_commit(lambda: _dispatch(instance, created))
+
+
+def _dispatch(instance, created):
+    """Fan a task event out to the organization's subscribed webhooks."""
     event = 'task.created' if created else 'task.updated'
     
     # Get organization webhooks
     try:
-        webhooks = Webhook.objects.filter(
-            organization=instance.project.organization,
+        # project is usually already cached on the instance (mutations load
+        # it for the permission check); organization_id avoids fetching the
+        # organization row at all.
+        project = instance.project
+        webhook_qs = Webhook.objects.filter(
+            organization_id=project.organization_id,
             is_active=True
         )
-        
-        if not webhooks.exists():
+        # Pre-filter by subscribed event in the database where the backend
+        # supports JSON containment (served by the GIN index on Postgres);
+        # SQLite falls back to the Python-side check below.
+        if connection.vendor == 'postgresql':
+            webhook_qs = webhook_qs.filter(events__contains=[event])
+
+        # One query for everything send_webhook needs; skips the separate
+        # .exists() round trip and per-row model instantiation. Secrets are
+        # encoded to bytes so the HMAC path never re-encodes them, and the
+        # event lists become frozensets for O(1) membership checks.
+        webhooks = [
+            (url, secret.encode(), frozenset(events))
+            for url, secret, events in webhook_qs.values_list('url', 'secret', 'events')
+        ]
+        if not webhooks:
             return
-            
+
         payload = {
             'event': event,
             'timestamp': str(instance.updated_at),
@@ -53,21 +104,22 @@ def task_updated(sender, instance, created, **kwargs):
                 'status': instance.status,
                 'priority': instance.priority,
                 'project': {
-                    'id': instance.project.id,
-                    'name': instance.project.name
+                    'id': project.id,
+                    'name': project.name
                 },
-                'assignee': instance.assignee.email if instance.assignee else None
+                'assignee': instance.assignee.email if instance.assignee_id else None
             }
         }
-        
-        for webhook in webhooks:
-            # Check if event is subscribed
-            # events is a JSON list, e.g., ["task.created", "task.updated"]
-            if event in webhook.events:
-                threading.Thread(
-                    target=send_webhook,
-                    args=(webhook.url, webhook.secret, payload)
-                ).start()
-                
+
+        # Serialize once for the whole fanout; only the per-secret HMAC
+        # differs between webhooks.
+        payload_bytes = json.dumps(payload).encode()
+
+        for url, secret_bytes, events in webhooks:
+            # Check if event is subscribed; events came from a JSON list,
+            # e.g., ["task.created", "task.updated"]
+            if event in events:
+                _webhook_pool.submit(send_webhook, url, secret_bytes, payload_bytes)
+
     except Exception as e:
         print(f"Error triggering webhooks: {e}")
@@ -72,8 +72,21 @@ class User(AbstractUser):
         """Return full_name or email as display name."""
         return self.full_name or self.email
     
-    def get_organizations(self):
-        """Return all organizations this user belongs to."""
-        from apps.organizations.models import Organization
-        return Organization.objects.filter(members__user=self)
+    def get_organizations(self, with_members=False):
+        """Return all organizations this user belongs to.
+
+        Pass ``with_members=True`` to prefetch each organization's
+        memberships (with their users), so callers that render member
+        lists avoid a query per organization.
+        """
+        from apps.organizations.models import Organization, OrganizationMember
+        queryset = Organization.objects.filter(organizationmember__user=self)
+        if with_members:
+            queryset = queryset.prefetch_related(
+                models.Prefetch(
+                    'organizationmember_set',
+                    queryset=OrganizationMember.objects.select_related('user'),
+                )
+            )
+        return queryset
 
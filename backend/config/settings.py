@@ -4,6 +4,7 @@ Multi-tenant application with GraphQL API.
 """
 
 import os
+import sys
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
@@ -107,6 +108,12 @@ AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
 ]
 
+# Under the test runner, swap the slow production hasher for MD5:
+# fixture users are created constantly and PBKDF2's work factor is pure
+# overhead there. check_password still round-trips correctly.
+if 'test' in sys.argv:
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 # Authentication backends for JWT
 AUTHENTICATION_BACKENDS = [
     'graphql_jwt.backends.JSONWebTokenBackend',
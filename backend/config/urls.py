@@ -7,7 +7,7 @@ from django.contrib import admin
 from django.urls import path
 from django.views.decorators.csrf import csrf_exempt
 from django.http import JsonResponse
-from graphene_django.views import GraphQLView
+from apps.graphql_api.views import CachedGraphQLView
 
 
 def health_check(request):
@@ -23,5 +23,5 @@ urlpatterns = [
     path('admin/', admin.site.urls),
 
     # GraphQL API endpoint with GraphiQL interface for development
-    path('graphql/', csrf_exempt(GraphQLView.as_view(graphiql=True))),
+    path('graphql/', csrf_exempt(CachedGraphQLView.as_view(graphiql=True))),
 ]
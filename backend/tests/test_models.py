@@ -1,8 +1,73 @@
+"""
+Model and API tests.
+
+All classes here must stay on ``django.test.TestCase``: it isolates
+tests by rolling back a transaction, which is roughly an order of
+magnitude faster than the per-test table flush that
+``TransactionTestCase`` performs. Only switch a class if it genuinely
+needs to observe committed data.
+"""
+
+from django.db.models.signals import post_save
 from django.test import TestCase
-from django.test import TestCase
+from graphql import execute_sync, parse
+
 from apps.users.models import User
 from apps.organizations.models import Organization, OrganizationMember
 from apps.projects.models import Project, Task, TaskComment
+from apps.projects.signals import task_updated
+from apps.graphql_api.schema import schema
+
+# Pre-bound enum values keep fixture construction off the descriptor
+# chain; fixtures reference these instead of Task.Status.* each time.
+TODO, IN_PROGRESS, DONE = Task.Status.TODO, Task.Status.IN_PROGRESS, Task.Status.DONE
+MEDIUM = Task.Priority.MEDIUM
+
+
+# One fixture user shared read-only by every class in this module;
+# created once per process in setUpModule instead of once per class.
+SHARED_USER = None
+
+
+def setUpModule():
+    global SHARED_USER
+    # Webhook dispatch is a network side effect no test here wants;
+    # disconnecting it also keeps every Task save signal-free.
+    post_save.disconnect(task_updated, sender=Task)
+    # setUpModule commits, so look the user up first to stay idempotent
+    # under --keepdb.
+    SHARED_USER = User.objects.filter(email='shared@test.com').first()
+    if SHARED_USER is None:
+        SHARED_USER = make_user('shared@test.com')
+
+
+def tearDownModule():
+    User.objects.filter(email='shared@test.com').delete()
+    post_save.connect(task_updated, sender=Task)
+
+
+def make_tasks(project, specs):
+    """Bulk-insert ``(title, status)`` task specs for a project.
+
+    One multi-row INSERT regardless of how many tasks a fixture needs;
+    use this instead of looping Task.objects.create.
+    """
+    return Task.objects.bulk_create(
+        [Task(project=project, title=title, status=status) for title, status in specs],
+        batch_size=500,
+    )
+
+
+def make_user(email):
+    """Create a fixture user without a usable password.
+
+    Skips the hashing step entirely; use it anywhere the test never
+    calls check_password or logs in.
+    """
+    user = User(email=email)
+    user.set_unusable_password()
+    user.save()
+    return user
 
 
 class UserModelTest(TestCase):
@@ -26,11 +91,9 @@ class UserModelTest(TestCase):
 class OrganizationModelTest(TestCase):
     """Tests for Organization and OrganizationMember models."""
     
-    def setUp(self):
-        self.user = User.objects.create_user(
-            email='owner@example.com',
-            password='testpass123'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = SHARED_USER
     
     def test_create_organization(self):
         """Test creating an organization with auto-slug."""
@@ -43,8 +106,11 @@ class OrganizationModelTest(TestCase):
     
     def test_organization_member_roles(self):
         """Test adding member with roles."""
+        # Slug passed explicitly: only test_create_organization cares
+        # about the auto-slug path.
         org = Organization.objects.create(
             name='Test Org',
+            slug='test-org',
             contact_email='test@org.com'
         )
         member = OrganizationMember.objects.create(
@@ -52,14 +118,19 @@ class OrganizationModelTest(TestCase):
             organization=org,
             role=OrganizationMember.Role.OWNER
         )
-        self.assertTrue(member.can_manage_projects())
-        self.assertTrue(member.can_manage_members())
-        self.assertTrue(member.can_edit_tasks())
-        self.assertFalse(member.is_read_only())
+        # The predicates are pure role comparisons; prove no query hides
+        # behind them by asserting the whole permission set at once.
+        with self.assertNumQueries(0):
+            self.assertEqual(member.permissions(), {
+                'manage_projects': True,
+                'manage_members': True,
+                'edit_tasks': True,
+                'read_only': False,
+            })
     
     def test_viewer_is_read_only(self):
         """Test that viewer role has read-only access."""
-        org = Organization.objects.create(name='Org', contact_email='o@o.com')
+        org = Organization.objects.create(name='Org', slug='org', contact_email='o@o.com')
         member = OrganizationMember.objects.create(
             user=self.user,
             organization=org,
@@ -72,9 +143,11 @@ class OrganizationModelTest(TestCase):
 class ProjectModelTest(TestCase):
     """Tests for Project model."""
     
-    def setUp(self):
-        self.org = Organization.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(
             name='Test Org',
+            slug='test-org',
             contact_email='test@org.com'
         )
     
@@ -94,13 +167,18 @@ class ProjectModelTest(TestCase):
             organization=self.org,
             name='Project with Tasks'
         )
-        # Create tasks with different statuses
-        Task.objects.create(project=project, title='Task 1', status=Task.Status.TODO)
-        Task.objects.create(project=project, title='Task 2', status=Task.Status.IN_PROGRESS)
-        Task.objects.create(project=project, title='Task 3', status=Task.Status.DONE)
-        Task.objects.create(project=project, title='Task 4', status=Task.Status.DONE)
+        # Create tasks with different statuses in one INSERT
+        make_tasks(project, [
+            ('Task 1', TODO),
+            ('Task 2', IN_PROGRESS),
+            ('Task 3', DONE),
+            ('Task 4', DONE),
+        ])
         
-        stats = project.get_task_stats()
+        # The stats come from a single aggregate; a higher count here
+        # means someone reintroduced per-status queries.
+        with self.assertNumQueries(1):
+            stats = project.get_task_stats()
         self.assertEqual(stats['total_tasks'], 4)
         self.assertEqual(stats['completed_tasks'], 2)
         self.assertEqual(stats['in_progress_tasks'], 1)
@@ -111,28 +189,26 @@ class ProjectModelTest(TestCase):
 class TaskModelTest(TestCase):
     """Tests for Task and TaskComment models."""
     
-    def setUp(self):
-        self.org = Organization.objects.create(
-            name='Org', contact_email='o@o.com'
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(
+            name='Org', slug='org', contact_email='o@o.com'
         )
-        self.project = Project.objects.create(
-            organization=self.org,
+        cls.project = Project.objects.create(
+            organization=cls.org,
             name='Project'
         )
-        self.user = User.objects.create_user(
-            email='user@example.com',
-            password='pass'
-        )
+        cls.user = SHARED_USER
     
     def test_create_task(self):
         """Test creating a task."""
         task = Task.objects.create(
             project=self.project,
             title='Test Task',
-            status=Task.Status.TODO
+            status=TODO
         )
         self.assertEqual(task.title, 'Test Task')
-        self.assertEqual(task.priority, Task.Priority.MEDIUM)
+        self.assertEqual(task.priority, MEDIUM)
     
     def test_task_with_assignee(self):
         """Test assigning task to user."""
@@ -141,7 +217,7 @@ class TaskModelTest(TestCase):
             title='Assigned Task',
             assignee=self.user
         )
-        self.assertEqual(task.assignee.email, 'user@example.com')
+        self.assertEqual(task.assignee.email, 'shared@test.com')
     
     def test_task_comment(self):
         """Test adding comment to task."""
@@ -155,41 +231,46 @@ class TaskModelTest(TestCase):
             author=self.user
         )
         self.assertEqual(comment.content, 'This is a comment')
-        self.assertEqual(task.comments.count(), 1)
+        # Reverse-manager access should stay a single COUNT query.
+        with self.assertNumQueries(1):
+            self.assertEqual(task.comments.count(), 1)
 
 
 class GraphQLAPITest(TestCase):
     """Tests for GraphQL API endpoints."""
+
+    # Parsed once at import; executing the cached document skips the
+    # per-call parse of the query string.
+    CREATE_USER_MUTATION = parse('''
+        mutation {
+            createUser(email: "new@user.com", password: "password123") {
+                success
+                user { email }
+            }
+        }
+    ''')
     
-    def setUp(self):
-        from graphene_django.utils.testing import GraphQLTestCase
-        self.user = User.objects.create_user(
-            email='api@test.com',
-            password='testpass'
-        )
-        self.org = Organization.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = SHARED_USER
+        cls.org = Organization.objects.create(
             name='API Test Org',
+            slug='api-test-org',
             contact_email='api@org.com'
         )
         OrganizationMember.objects.create(
-            user=self.user,
-            organization=self.org,
+            user=cls.user,
+            organization=cls.org,
             role=OrganizationMember.Role.OWNER
         )
     
     def test_create_user_mutation(self):
         """Test user creation via GraphQL."""
-        from apps.graphql_api.schema import schema
-        
-        result = schema.execute('''
-            mutation {
-                createUser(email: "new@user.com", password: "password123") {
-                    success
-                    user { email }
-                }
-            }
-        ''')
-        
+        # One INSERT; the response fields resolve from the in-memory
+        # instance. More queries here means a resolver regressed.
+        with self.assertNumQueries(1):
+            result = execute_sync(schema.graphql_schema, self.CREATE_USER_MUTATION)
+
         self.assertIsNone(result.errors)
         self.assertTrue(result.data['createUser']['success'])
         self.assertEqual(result.data['createUser']['user']['email'], 'new@user.com')